@@ -1,32 +1,107 @@
 import argparse
+import functools
 import logging
 import random
 import sys
-from dataclasses import dataclass
-from typing import ClassVar, Literal
+from collections.abc import Callable, Sequence  # noqa: TC003 breaks 3.10 - 3.13
+from typing import ClassVar
 
 from presidents_quiz.formatting import format_as_percent
-from presidents_quiz.presidents import ALL_PRESIDENTS, NUM_PRESIDENTS
+from presidents_quiz.presidents import NUM_PRESIDENTS, QUESTION_NAME, QUESTION_ORDER, QUESTION_YEAR, President, presidents_in_range
 from presidents_quiz.quiz_settings import QuizSettings
 from presidents_quiz.quiz_statistics import QuizStatistics
-from presidents_quiz.responses import get_response
+from presidents_quiz.responses import get_question_response
 
 LOGGER = logging.getLogger(__name__)
 
 GAME_STATS = QuizStatistics()
 GAME_SETTINGS = QuizSettings()
 
-def parse_arguments(settings: QuizSettings) -> None:
-    """Parse command line arguments into passed settings object."""
-    # Type-hint parsed arguments (https://stackoverflow.com/questions/42279063/python-typehints-for-argparse-namespace-objects)
-    @dataclass
-    class ArgumentTypes:
-        repeat: bool
-        end_early: bool
-        range: tuple[int, int]
-        verbosity: Literal[0, 1, 2]
-        allow_ambiguity: bool
+# argument help, built once at import; NUM_PRESIDENTS is fixed by then too
+_HELP_REPEAT = "Allows repeat questions before all questions have been exhausted. Can not be used with --end-early. (Default: false)"
+_HELP_END_EARLY = "Ends questions when all have been asked. Can not be used with --repeat. (Default: false)"
+_HELP_AMBIGUITY = ("Allows amibguous answers. For example, 'John Adams' will count for both presidents if this flag is true. "
+                   "(Default: false)")
+_HELP_RANGE = f"Range of presidents to include, (1-{NUM_PRESIDENTS}). (Default: all)"
+_HELP_VERBOSITY = "Verbosity level: 0 = quiet, 1 = normal, 2 = verbose. (Default: 1)"
+_ERROR_RANGE = f"Must be between 1 and {NUM_PRESIDENTS}, inclusive, with START <= END."
+# final statistics lines are indented under their heading
+_SUMMARY_INDENT = " " * 14
+
+# part of a question -> check of the user's answer for that part
+_ANSWER_CHECKS: dict[str, Callable[[President, str], bool]] = {
+    "name": lambda president, answer: president.check_name(answer, allow_ambiguity=GAME_SETTINGS.allow_ambiguity),
+    "order": lambda president, answer: president.check_order(answer),
+    "year": lambda president, answer: president.check_year(answer),
+}
+
+# part of a question -> keyword for recording its result
+_RECORD_KEYWORDS = {
+    "name": "correct_name",
+    "order": "correct_order",
+    "year": "correct_year",
+}
+
+# question type -> (clue shown, first part asked, its prompt, second part asked, its prompt)
+_QUESTIONS: dict[str, tuple[Callable[[President], str], str, str, str, str]] = {
+    QUESTION_YEAR: (lambda president: f"Year = {president.start_year_str}:",
+                    "name", "Who was the president? ",
+                    "order", "What was the order number? (if multiple, separate with spaces) "),
+    QUESTION_ORDER: (lambda president: f"Order number = {president.order_numbers_str}:",
+                     "name", "Who was the president? ",
+                     "year", "What year did they start their term? (if multiple, separate with spaces) "),
+    QUESTION_NAME: (lambda president: f"President = {president}:",
+                    "order", "What was their order number? (if multiple, separate with spaces) ",
+                    "year", "What year did they start their term? (if multiple, separate with spaces) "),
+}
+
+class SeverityFormatter(logging.Formatter):
+    """Logging formatter that changes format based on severity."""
+
+    FORMATS: ClassVar[dict[int, str]] = {
+        logging.DEBUG: "[%(name)s:DEBUG] %(message)s",
+        logging.INFO: "%(message)s",
+        logging.WARNING: "[WARNING] %(message)s",
+        logging.ERROR: "[ERROR] %(message)s",
+        logging.CRITICAL: "[CRITICAL] %(message)s",
+    }
+    def __init__(self) -> None:
+        """Build one formatter per level instead of swapping _style._fmt on every record."""
+        super().__init__()
+        self._formatters = {level: logging.Formatter(fmt) for level, fmt in self.FORMATS.items()}
+        self._default_formatter = logging.Formatter("%(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format record with the formatter for its level."""
+        return self._formatters.get(record.levelno, self._default_formatter).format(record)
+
+def reset_game_state() -> None:
+    """Reset the game's settings and statistics singletons in place to their defaults."""
+    GAME_SETTINGS.reset()
+    GAME_STATS.reset()
+
+def _setup_logging(settings: QuizSettings) -> None:
+    """Set the root logging level from settings and attach the severity handler once."""
+    root = logging.getLogger()
 
+    # Update logging level based on verbosity
+    if settings.verbose_level == settings.VERBOSE_QUIET:
+        root.setLevel(logging.ERROR)
+    elif settings.verbose_level == settings.VERBOSE_VERBOSE:
+        root.setLevel(logging.DEBUG)
+    else: # settings.VERBOSE_NORMAL
+        root.setLevel(logging.INFO)
+
+    # parsing again must not duplicate every log line
+    if any(isinstance(handler.formatter, SeverityFormatter) for handler in root.handlers):
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(SeverityFormatter())
+    root.addHandler(handler)
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it for every parse."""
     # TODO: add "sequential" option for going in order instead of random
     parser = argparse.ArgumentParser(description="Quiz game for US presidents.")
     # ensure -r and -e cant be used together
@@ -34,43 +109,48 @@ def parse_arguments(settings: QuizSettings) -> None:
     repeat_group.add_argument("-r",
                               "--repeat",
                               action="store_true",
-                              help=(
-                                  "Allows repeat questions before all questions have been exhausted. "
-                                  "Can not be used with --end-early. (Default: false)"
-                              ))
+                              help=_HELP_REPEAT)
     repeat_group.add_argument("-e",
                               "--end-early",
                               action="store_true",
-                              help="Ends questions when all have been asked. Can not be used with --repeat. (Default: false)")
+                              help=_HELP_END_EARLY)
     parser.add_argument("-a",
                         "--allow-ambiguity",
                         action="store_true",
-                        help=(
-                            "Allows amibguous answers. For example, 'John Adams' will count for both presidents if this flag is true. "
-                            "(Default: false)"
-                        ))
+                        help=_HELP_AMBIGUITY)
     parser.add_argument("-R",
                         "--range",
                         type=int,
                         nargs=2,
                         metavar=("START", "END"),
                         default=(1, NUM_PRESIDENTS),
-                        help=f"Range of presidents to include, (1-{NUM_PRESIDENTS}). (Default: all)")
+                        help=_HELP_RANGE)
     parser.add_argument("-v",
                         "--verbosity",
                         type=int,
                         choices=[0, 1, 2],
                         default=1,
-                        help="Verbosity level: 0 = quiet, 1 = normal, 2 = verbose. (Default: 1)")
+                        help=_HELP_VERBOSITY)
+
+    return parser
 
-    args = ArgumentTypes(**parser.parse_args().__dict__)
+def parse_arguments(settings: QuizSettings, argv: Sequence[str] | None = None) -> None:
+    """Parse command line arguments into passed settings object.
+
+    Args:
+        settings (QuizSettings): Settings object to update.
+        argv (Sequence[str] | None): Arguments to parse. Defaults to sys.argv[1:].
+    """
+    parser = _build_parser()
+
+    # read straight off the Namespace; repacking it into a dataclass only copied it
+    args = parser.parse_args(argv)
 
     # error if bad presidents range
     if 1 <= args.range[0] <= args.range[1] <= NUM_PRESIDENTS:
         good_range = (args.range[0], args.range[1])
     else:
-        parser.error(f"Invalid range: {args.range}. Must be between 1 and "
-                     f"{NUM_PRESIDENTS}, inclusive, with START <= END.")
+        parser.error(f"Invalid range: {args.range}. {_ERROR_RANGE}")
 
     settings.update(repeat_questions=args.repeat,
                     end_early=args.end_early,
@@ -78,136 +158,88 @@ def parse_arguments(settings: QuizSettings) -> None:
                     verbose_level=args.verbosity,
                     allow_ambiguity=args.allow_ambiguity)
 
-    root = logging.getLogger()
+    _setup_logging(settings)
 
-    # TODO: move to logging setup function
-    # Update logging level based on verbosity
-    if settings.verbose_level == settings.VERBOSE_QUIET:
-        root.setLevel(logging.ERROR)
-    elif settings.verbose_level == settings.VERBOSE_VERBOSE:
-        root.setLevel(logging.DEBUG)
-    else: # settings.VERBOSE_NORMAL
-        root.setLevel(logging.INFO)
+def _ask_question(president: President, question_type: str) -> None:
+    """Ask one question about president, then record and print the results."""
+    clue, first, first_prompt, second, second_prompt = _QUESTIONS[question_type]
 
-    # Add a formatter that changes format based on severity
-    class SeverityFormatter(logging.Formatter):
-        FORMATS: ClassVar[dict[int, str]] = {
-            logging.DEBUG: "[%(name)s:DEBUG] %(message)s",
-            logging.INFO: "%(message)s",
-            logging.WARNING: "[WARNING] %(message)s",
-            logging.ERROR: "[ERROR] %(message)s",
-            logging.CRITICAL: "[CRITICAL] %(message)s",
-        }
-        def format(self, record: logging.LogRecord) -> str:
-            fmt = self.FORMATS.get(record.levelno, "%(message)s")
-            self._style._fmt = fmt  # noqa: SLF001
-            return super().format(record)
+    # one write per line instead of print's separate newline write
+    sys.stdout.write(clue(president) + "\n")
+    first_answer = input(first_prompt)
+    first_result = _ANSWER_CHECKS[first](president, first_answer)
+    second_answer = input(second_prompt)
+    second_result = _ANSWER_CHECKS[second](president, second_answer)
 
-    handler = logging.StreamHandler()
-    handler.setFormatter(SeverityFormatter())
-    root.addHandler(handler)
+    LOGGER.debug("User input: %s='%s', %s='%s'", first, first_answer, second, second_answer)
+    LOGGER.debug("Check results: %s=%s, %s=%s", first, first_result, second, second_result)
+    # pretty_print() is built eagerly, so skip it unless it will be shown
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
+        LOGGER.debug("Before recording: %s", GAME_STATS.pretty_print())
+    GAME_STATS.record(**{_RECORD_KEYWORDS[first]: first_result, _RECORD_KEYWORDS[second]: second_result})
+    if debug:
+        LOGGER.debug("After recording: %s", GAME_STATS.pretty_print())
+
+    # the parts are asked in the order the responses expect, so no validation is needed
+    sys.stdout.write(get_question_response(president, question_type, first_result, second_result) + "\n")
 
 def main() -> None:
     """Run the main game loop."""
-    starting_presidents = ALL_PRESIDENTS[GAME_SETTINGS.president_range[0] - 1 : GAME_SETTINGS.president_range[1]]
-    LOGGER.debug("Starting presidents: %s", [str(p) for p in starting_presidents])
-    expected_length = GAME_SETTINGS.president_range[1] - GAME_SETTINGS.president_range[0] + 1
+    range_start, range_end = GAME_SETTINGS.president_range
+    starting_presidents = presidents_in_range(range_start, range_end)
+    # the name lists are only worth building when debug logging is on
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Starting presidents: %s", [str(p) for p in starting_presidents])
+    expected_length = range_end - range_start + 1
     if len(starting_presidents) != expected_length:
         LOGGER.error("President range does not match number of starting presidents. Expected length: %s from (%s, %s), got %s.",
-                     expected_length, GAME_SETTINGS.president_range[0], GAME_SETTINGS.president_range[1], len(starting_presidents))
+                     expected_length, range_start, range_end, len(starting_presidents))
         sys.exit(1)
 
-    remaining_presidents = starting_presidents.copy()
+    # one pool for the whole game, reshuffled in place on each pass; presidents
+    # before next_index have already been asked this pass
+    president_pool = list(starting_presidents)
+    random.shuffle(president_pool)
+    next_index = 0
 
     while True:
-        print(f"\nRound number {GAME_STATS.total_questions + 1}! (ctrl-c to quit)")
+        sys.stdout.write(f"\nRound number {GAME_STATS.total_questions + 1}! (ctrl-c to quit)\n")
         # by default, don't repeat questions until all have been asked
-        if len(remaining_presidents) == 0 and GAME_SETTINGS.end_early:
-            print("All presidents have been asked! Ending...")
+        if next_index == len(president_pool) and GAME_SETTINGS.end_early:
+            sys.stdout.write("All presidents have been asked! Ending...\n")
             raise KeyboardInterrupt
 
-        if len(remaining_presidents) == 0:
+        if next_index == len(president_pool):
             LOGGER.info("All presidents have been asked! Restarting...")
-            remaining_presidents = starting_presidents.copy()
+            random.shuffle(president_pool)
+            next_index = 0
 
         if not GAME_SETTINGS.repeat_questions:
-            LOGGER.debug("Remaining presidents: %s", [str(p) for p in remaining_presidents])
-            current_president = random.choice(remaining_presidents)
-            remaining_presidents.remove(current_president)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Remaining presidents: %s", [str(p) for p in president_pool[next_index:]])
+            current_president = president_pool[next_index]
+            next_index += 1
         else:
             current_president = random.choice(starting_presidents)
 
         # what information do we give the user?
-        # not year if it is an ambiguous year
-        question_type = random.choice(["name", "order"] if current_president.is_year_ambiguous() else ["year", "order", "name"])
-
-        if question_type == "year":
-            start_year_str = " and ".join(current_president.start_year)
-
-            print(f"Year = {start_year_str}:")
-            user_name = input("Who was the president? ")
-            check_name_result = current_president.check_name(user_name, allow_ambiguity=GAME_SETTINGS.allow_ambiguity)
-            user_order = input("What was the order number? (if multiple, separate with spaces) ")
-            check_order_result = current_president.check_order(user_order)
-
-            # TODO: move logging to function to allow reuse between question types
-            LOGGER.debug("User input: name='%s', order='%s'", user_name, user_order)
-            LOGGER.debug("Check results: name=%s, order=%s", check_name_result, check_order_result)
-            LOGGER.debug("Before recording: %s", GAME_STATS.pretty_print())
-            GAME_STATS.record_year_question(correct_name=check_name_result, correct_order=check_order_result)
-            LOGGER.debug("After recording: %s", GAME_STATS.pretty_print())
-
-            print(
-                get_response(current_president,
-                question_type,
-                check_name_result=check_name_result,
-                check_order_result=check_order_result,
-                check_year_result=None),
-                )
-        elif question_type == "order":
-            order_str = " and ".join(current_president.order_numbers)
-
-            print(f"Order number = {order_str}:")
-            user_name = input("Who was the president? ")
-            check_name_result = current_president.check_name(user_name, allow_ambiguity=GAME_SETTINGS.allow_ambiguity)
-            user_year = input("What year did they start their term? (if multiple, separate with spaces) ")
-            check_year_result = current_president.check_year(user_year)
-
-            LOGGER.debug("User input: name='%s', year='%s'", user_name, user_year)
-            LOGGER.debug("Check results: name=%s, year=%s", check_name_result, check_year_result)
-            LOGGER.debug("Before recording: %s", GAME_STATS.pretty_print())
-            GAME_STATS.record_order_question(correct_name=check_name_result, correct_year=check_year_result)
-            LOGGER.debug("After recording: %s", GAME_STATS.pretty_print())
-
-            print(
-                get_response(current_president,
-                             question_type,
-                             check_name_result=check_name_result,
-                             check_order_result=None,
-                             check_year_result=check_year_result),
-                )
-        elif question_type == "name":
-            name_str = current_president.get_president_name()
-
-            print(f"President = {name_str}:")
-            user_order = input("What was their order number? (if multiple, separate with spaces) ")
-            check_order_result = current_president.check_order(user_order)
-            user_year = input("What year did they start their term? (if multiple, separate with spaces) ")
-            check_year_result = current_president.check_year(user_year)
-
-            LOGGER.debug("User input: order='%s', year='%s'", user_order, user_year)
-            LOGGER.debug("Check results: order=%s, year=%s", check_order_result, check_year_result)
-            LOGGER.debug("Before recording: %s", GAME_STATS.pretty_print())
-            GAME_STATS.record_name_question(correct_order=check_order_result, correct_year=check_year_result)
-            LOGGER.debug("After recording: %s", GAME_STATS.pretty_print())
-
-            print(
-                get_response(current_president,
-                             question_type,
-                             check_name_result=None,
-                             check_order_result=check_order_result,
-                             check_year_result=check_year_result),
-                )
+        question_type = random.choice(current_president.question_types)
+
+        _ask_question(current_president, question_type)
+
+def _format_final_statistics(stats: QuizStatistics) -> str:
+    """Return the end-of-game statistics summary, one indented line per statistic."""
+    total = stats.total_questions
+    lines = (
+        f"Total questions: {total}",
+        f"Correct questions: {stats.correct_questions} ({format_as_percent(stats.correct_questions, total)})",
+        f"Half-correct questions: {stats.half_correct_questions} ({format_as_percent(stats.half_correct_questions, total)})",
+        f"Correct names: {stats.correct_names} ({format_as_percent(stats.correct_names, stats.name_questions)})",
+        f"Correct orders: {stats.correct_orders} ({format_as_percent(stats.correct_orders, stats.order_questions)})",
+        f"Correct years: {stats.correct_years} ({format_as_percent(stats.correct_years, stats.year_questions)})",
+    )
+    return "\n\nFinal statistics:\n\n" + "\n".join(_SUMMARY_INDENT + line for line in lines) + "\n"
 
 def cli() -> None:
     """Initialize CLI.
@@ -215,21 +247,13 @@ def cli() -> None:
     Parse arguments, handle keyboard interrupt.
     """
     parse_arguments(GAME_SETTINGS)
-    LOGGER.debug(GAME_SETTINGS.pretty_print())
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(GAME_SETTINGS.pretty_print())
 
     try:
         main()
     except KeyboardInterrupt:
-        print(f"""\n\nFinal statistics:
-
-              Total questions: {GAME_STATS.total_questions}
-              Correct questions: {GAME_STATS.correct_questions} """
-              f"""({(GAME_STATS.correct_questions / GAME_STATS.total_questions * 100) if GAME_STATS.total_questions > 0 else 0:.2f}%)
-              Half-correct questions: """
-              f"""{GAME_STATS.half_correct_questions} ({format_as_percent(GAME_STATS.half_correct_questions, GAME_STATS.total_questions)})
-              Correct names: {GAME_STATS.correct_names} ({format_as_percent(GAME_STATS.correct_names, GAME_STATS.name_questions)})
-              Correct orders: {GAME_STATS.correct_orders} ({format_as_percent(GAME_STATS.correct_orders, GAME_STATS.order_questions)})
-              Correct years: {GAME_STATS.correct_years} ({format_as_percent(GAME_STATS.correct_years, GAME_STATS.year_questions)})""")
+        sys.stdout.write(_format_final_statistics(GAME_STATS))
 
         LOGGER.info("\nExiting...")
         sys.exit(1)
@@ -1,32 +1,94 @@
+import functools
 import logging
-
-__all__ = ["ALL_PRESIDENTS", "NUM_PRESIDENTS", "President"]
+import string
+
+__all__ = [
+    "ALL_PRESIDENTS",
+    "NUM_PRESIDENTS",
+    "QUESTION_NAME",
+    "QUESTION_ORDER",
+    "QUESTION_YEAR",
+    "President",
+    "presidents_in_range",
+]
 
 LOGGER = logging.getLogger(__name__)
 
+# question types, shared as dict keys by the game loop and responses
+QUESTION_YEAR = "year"
+QUESTION_ORDER = "order"
+QUESTION_NAME = "name"
+
+# drops dots from answers, e.g. middle initials
+_REMOVE_DOTS = str.maketrans("", "", ".")
+# lowercases ASCII letters and drops dots in a single pass
+_NORMALIZE_ASCII_NAME = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, ".")
+
+# bounded: construction alone normalizes a few name forms per president, and answers repeat across rounds
+@functools.lru_cache(maxsize=512)
+def _normalize_name(given_name: str) -> str:
+    """Return a name answer stripped of surrounding whitespace, lowercased, and without dots."""
+    given_name = given_name.strip()
+    # answers typed in lowercase without dots are already normalized
+    if "." not in given_name and given_name.islower():
+        return given_name
+    if given_name.isascii():
+        return given_name.translate(_NORMALIZE_ASCII_NAME)
+    # the table only covers ASCII letters, leave other alphabets to str.lower
+    return given_name.lower().translate(_REMOVE_DOTS)
+
 class President:
     """Represents a U.S. president with name details, order numbers, and start years.
 
     Attributes:
-        AMBIGIOUS_FULL_NAMES (list[str]): Full names requiring disambiguation.
-        HALF_AMBIGIOUS_FULL_NAMES (list[str]): Full names ambiguous without middle name.
-        AMBIGIOUS_LAST_NAMES (list[str]): Last names shared by multiple presidents.
+        AMBIGIOUS_FULL_NAMES (frozenset[str]): Full names requiring disambiguation.
+        HALF_AMBIGIOUS_FULL_NAMES (frozenset[str]): Full names ambiguous without middle name.
+        AMBIGIOUS_LAST_NAMES (frozenset[str]): Last names shared by multiple presidents.
+        AMBIGIOUS_YEARS (frozenset[str]): Start years shared by multiple presidents.
         first_name (str): President's first name.
         last_name (str): President's last name.
         middle_name (str | None): Middle name or initial, if any.
         nickname (str | None): Nickname, if any.
         order_numbers (list[str]): Presidential order numbers.
         start_year (list[str]): Years presidency started.
+        order_numbers_str (str): Order numbers joined with " and " for display.
+        start_year_str (str): Start years joined with " and " for display.
+        question_types (tuple[str, ...]): Question types that can be asked about this president.
+        name_forms (frozenset[str]): Normalized name answers that identify this president.
+        ambiguous_name_forms (frozenset[str]): Normalized name answers only accepted with allow_ambiguity.
     """
-    # lists of ambigious names in lowercase
+    # fixed attribute layout; presidents are created once and read every round
+    __slots__ = (
+        "_full_name",
+        "_full_name_ambiguous",
+        "_last_name_ambiguous",
+        "_order_numbers_answer",
+        "_start_year_answer",
+        "_year_ambiguous",
+        "ambiguous_name_forms",
+        "first_name",
+        "last_name",
+        "middle_name",
+        "name_forms",
+        "nickname",
+        "order_numbers",
+        "order_numbers_str",
+        "question_types",
+        "start_year",
+        "start_year_str",
+    )
+
+    # sets of ambigious names in lowercase
     # both george bushes require middle initials to disambiguate
-    AMBIGIOUS_FULL_NAMES = ("george bush",)
+    AMBIGIOUS_FULL_NAMES = frozenset({"george bush"})
     # currently only john adams is half-ambiguous, meaning if no middle name is given,
     # it's 1979 adams
-    HALF_AMBIGIOUS_FULL_NAMES = ("john adams",)
-    AMBIGIOUS_LAST_NAMES = ("adams", "bush", "roosevelt", "johnson", "harrison")
+    HALF_AMBIGIOUS_FULL_NAMES = frozenset({"john adams"})
+    AMBIGIOUS_LAST_NAMES = frozenset({"adams", "bush", "roosevelt", "johnson", "harrison"})
+    # answers check_name warns about
+    _AMBIGIOUS_FULL_OR_LAST_NAMES = AMBIGIOUS_FULL_NAMES | AMBIGIOUS_LAST_NAMES
     # died first year in office
-    AMBIGIOUS_YEARS = ("1841", "1881")
+    AMBIGIOUS_YEARS = frozenset({"1841", "1881"})
     def __init__(self,
                  first_name: str,
                  last_name: str,
@@ -42,16 +104,65 @@ class President:
         self.start_year = start_year
         self.middle_name = middle_name
         self.nickname = nickname
+        self.order_numbers_str = " and ".join(order_numbers)
+        self.start_year_str = " and ".join(start_year)
+        # multiple order numbers or years are answered space separated
+        self._order_numbers_answer = " ".join(order_numbers)
+        self._start_year_answer = " ".join(start_year)
+
+        # name and ambiguity never change, so work them out once instead of per question
+        if middle_name is not None:
+            self._full_name = f"{first_name} {middle_name} {last_name}"
+        else:
+            self._full_name = f"{first_name} {last_name}"
+        # lowercase forms check_name compares answers against
+        # built with the same normalization as answers so both sides always match
+        first_last = _normalize_name(first_name + " " + last_name)
+        last = _normalize_name(last_name)
+        self._full_name_ambiguous = first_last in self.AMBIGIOUS_FULL_NAMES
+        self._last_name_ambiguous = last in self.AMBIGIOUS_LAST_NAMES
+        self._year_ambiguous = not self.AMBIGIOUS_YEARS.isdisjoint(start_year)
+        # answers that always identify this president, and those only accepted with -a
+        name_forms: set[str] = set()
+        ambiguous_name_forms: set[str] = set()
+        # if half-ambiguous, go with no-middle-name option
+        # right now, this is only john adams
+        # e.g., "John Adams" -> John Adams (1797)
+        # "John Quincy Adams" -> John Quincy Adams (1825)
+        if self._full_name_ambiguous or (first_last in self.HALF_AMBIGIOUS_FULL_NAMES and middle_name is not None):
+            ambiguous_name_forms.add(first_last)
+        else:
+            name_forms.add(first_last)
+        if middle_name is not None:
+            # ignore periods in middle initial
+            name_forms.add(_normalize_name(first_name + " " + middle_name + " " + last_name))
+            # e.g., "Quincy Adams" -> John Quincy Adams (1825)
+            name_forms.add(_normalize_name(middle_name + " " + last_name))
+        # e.g., "Teddy" -> Theodore Roosevelt (1901)
+        if nickname is not None:
+            name_forms.add(_normalize_name(nickname))
+        if self._last_name_ambiguous:
+            ambiguous_name_forms.add(last)
+        else:
+            name_forms.add(last)
+        # allow "Buren" for "Van Buren" if allow ambiguity is on
+        if last == "van buren":
+            ambiguous_name_forms.add("buren")
+        self.name_forms = frozenset(name_forms)
+        self.ambiguous_name_forms = frozenset(ambiguous_name_forms)
+        # not year if it is an ambiguous year
+        if self._year_ambiguous:
+            self.question_types = (QUESTION_NAME, QUESTION_ORDER)
+        else:
+            self.question_types = (QUESTION_YEAR, QUESTION_ORDER, QUESTION_NAME)
 
     def __str__(self) -> str:
         """Return a string representation of the president."""
-        return self.get_president_name()
+        return self._full_name
 
     def get_president_name(self) -> str:
         """Return the full name of the president."""
-        if self.middle_name is not None:
-            return f"{self.first_name} {self.middle_name} {self.last_name}"
-        return f"{self.first_name} {self.last_name}"
+        return self._full_name
 
     def is_full_name_ambiguous(self) -> bool:
         """Check if the president's full name is ambiguous.
@@ -59,8 +170,7 @@ class President:
         Returns:
             bool: True if the full name is ambiguous, False otherwise.
         """
-        return self.first_name.lower() + " " + self.last_name.lower() \
-            in self.AMBIGIOUS_FULL_NAMES
+        return self._full_name_ambiguous
 
     def is_last_name_ambiguous(self) -> bool:
         """Check if the president's last name is ambiguous.
@@ -68,7 +178,7 @@ class President:
         Returns:
             bool: True if the last name is ambiguous, False otherwise.
         """
-        return self.last_name.lower() in self.AMBIGIOUS_LAST_NAMES
+        return self._last_name_ambiguous
 
     def is_year_ambiguous(self) -> bool:
         """Check if the president's start year is ambiguous.
@@ -76,7 +186,7 @@ class President:
         Returns:
             bool: True if the start year is ambiguous, False otherwise.
         """
-        return any(year in self.AMBIGIOUS_YEARS for year in self.start_year)
+        return self._year_ambiguous
 
     def check_name(self, given_name: str, *, allow_ambiguity: bool) -> bool:
         """Verify the user's input matches the president's name.
@@ -89,88 +199,28 @@ class President:
         - last
         If the given input is ambiguous (e.g., "John Adams"), return False.
         """
-        first_last = self.first_name.lower() + " " + self.last_name.lower()
-
-        if self.middle_name is not None:
-            first_middle_last = self.first_name.lower() + " " + self.middle_name.lower() + " " + self.last_name.lower()
-            middle_last = self.middle_name.lower() + " " + self.last_name.lower()
-            # ignore periods in middle initial
-            first_middle_last = first_middle_last.replace(".", "")
-            middle_last = middle_last.replace(".", "")
-        else:
-            first_middle_last = None
-            middle_last = None
-
-        nickname = None if self.nickname is None else self.nickname.lower()
-
-        last = self.last_name.lower()
-        # strip leading and ending whitespace and remove dots
-        given_name = given_name.lower().strip().replace(".", "")
+        given_name = _normalize_name(given_name)
 
         # warn on ambiguous name
-        if given_name in self.AMBIGIOUS_FULL_NAMES + self.AMBIGIOUS_LAST_NAMES:
+        if given_name in self._AMBIGIOUS_FULL_OR_LAST_NAMES:
             if allow_ambiguity:
                 LOGGER.debug("Ambiguous name provided: '%s'. Allowed because of -a flag.", given_name)
             else:
                 LOGGER.warning("Ambiguous name provided: '%s'", given_name)
 
-        # if half-ambiguous, go with no-middle-name option
-        # right now, this is only john adams
-        # e.g., "John Adams" -> John Adams (1797)
-        # "John Quincy Adams" -> John Quincy Adams (1825)
-        if first_last == given_name and first_last in self.HALF_AMBIGIOUS_FULL_NAMES:
-            # give player benifit of the doubt if allow ambiguity is on
-            return allow_ambiguity or self.middle_name is None
-
-        # explicity check for ambiguous names
-        if first_last == given_name and given_name not in self.AMBIGIOUS_FULL_NAMES:
+        # every accepted answer was worked out in __init__, so this is just set lookups
+        if given_name in self.name_forms:
             return True
-
-        # allow ambiguous names with -a flag
-        if first_last == given_name and given_name in self.AMBIGIOUS_FULL_NAMES and allow_ambiguity:
-            return True
-
-        if first_middle_last == given_name:
-            return True
-
-        # e.g., "Quincy Adams" -> John Quincy Adams (1825)
-        if middle_last == given_name:
-            return True
-
-        # e.g., "Teddy" -> Theodore Roosevelt (1901)
-        if nickname == given_name:
-            return True
-
-        # explicity check for ambiguous last names
-        if last == given_name and given_name not in self.AMBIGIOUS_LAST_NAMES:
-            return True
-
-        if last == given_name and given_name in self.AMBIGIOUS_LAST_NAMES and allow_ambiguity:
-            return True
-
-        # allow "Buren" for "Van Buren" if allow ambiguity is on
-        if given_name == "buren" and last == "van buren" and allow_ambiguity:  # noqa: SIM103 less readable
-            return True
-
-        return False
+        # give player benifit of the doubt if allow ambiguity is on
+        return allow_ambiguity and given_name in self.ambiguous_name_forms
 
     def check_order(self, given_order: str) -> bool:
         """Verify the user's input matches the president's order number(s)."""
-        given_order = given_order.strip()
-
-        if len(self.order_numbers) > 1:
-            return given_order == " ".join(self.order_numbers)
-
-        return given_order == self.order_numbers[0]
+        return given_order.strip() == self._order_numbers_answer
 
     def check_year(self, given_year: str) -> bool:
         """Verify the user's input matches the president's start year(s)."""
-        given_year = given_year.strip()
-
-        if len(self.start_year) > 1:
-            return given_year == " ".join(self.start_year)
-
-        return given_year == self.start_year[0]
+        return given_year.strip() == self._start_year_answer
 
 GEORGE_WASHINGTON = President("George", "Washington", ["1"], ["1789"])
 JOHN_ADAMS = President("John", "Adams", ["2"], ["1797"])
@@ -218,7 +268,7 @@ GEORGE_W_BUSH = President("George", "Bush", ["43"], ["2001"], middle_name="W.")
 BARACK_OBAMA = President("Barack", "Obama", ["44"], ["2009"])
 DONALD_TRUMP = President("Donald", "Trump", ["45", "47"], ["2017", "2025"])
 JOE_BIDEN = President("Joe", "Biden", ["46"], ["2021"])
-ALL_PRESIDENTS = [
+ALL_PRESIDENTS = (
     GEORGE_WASHINGTON,
     JOHN_ADAMS,
     THOMAS_JEFFERSON,
@@ -264,5 +314,13 @@ ALL_PRESIDENTS = [
     BARACK_OBAMA,
     DONALD_TRUMP,
     JOE_BIDEN,
-]
+)
 NUM_PRESIDENTS = len(ALL_PRESIDENTS) # 45 distinct presidents
+
+@functools.cache
+def presidents_in_range(start: int, end: int) -> tuple[President, ...]:
+    """Return the presidents with order numbers start through end, inclusive.
+
+    Each range is sliced once and shared by every game that asks for it.
+    """
+    return ALL_PRESIDENTS[start - 1 : end]
@@ -21,6 +21,14 @@ class QuizSettings:
         verbose_level (Literal[0, 1, 2]): Verbosity level.
         allow_ambiguity (bool): If true, ambiguous answers are allowed.
     """
+    # fixed attribute layout; settings are read every round
+    __slots__ = (
+        "allow_ambiguity",
+        "end_early",
+        "president_range",
+        "repeat_questions",
+        "verbose_level",
+    )
 
     VERBOSE_QUIET = 0
     VERBOSE_NORMAL = 1
@@ -29,9 +37,13 @@ class QuizSettings:
 
     def __init__(self) -> None:
         """Initialize Settings with default configuration options."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the default configuration options."""
         self.repeat_questions = False
         self.end_early = False
-        self.president_range = (1, NUM_PRESIDENTS + 1)
+        self.president_range = (1, NUM_PRESIDENTS)
         self.verbose_level = 1
         self.allow_ambiguity = False
 
@@ -43,18 +55,18 @@ class QuizSettings:
                president_range: tuple[int, int] | None = None,
                verbose_level: int | None = None) -> None:
         """Update settings flags."""
-        if self.repeat_questions is not None:
+        if repeat_questions is not None:
             self.repeat_questions = repeat_questions
-        if self.end_early is not None:
+        if end_early is not None:
             self.end_early = end_early
         if allow_ambiguity is not None:
             self.allow_ambiguity = allow_ambiguity
         if president_range is not None:
             # fallback to default range if outside of range
-            if 1 <= president_range[0] <= president_range[1] <= NUM_PRESIDENTS + 1:
+            if 1 <= president_range[0] <= president_range[1] <= NUM_PRESIDENTS:
                 self.president_range = president_range
             else:
-                LOGGER.warning("Range arguments not possible. Setting back to default of (1, %s).", NUM_PRESIDENTS + 1)
+                LOGGER.warning("Range arguments not possible. Setting back to default of (1, %s).", NUM_PRESIDENTS)
         if verbose_level is not None:
             # fallback to default verbosity if outside of range
             if verbose_level in self.POSSIBLE_VERBOSE_LEVELS:
@@ -14,8 +14,25 @@ class QuizStatistics:
         correct_years (int): Number of times the start year was answered correctly.
         year_questions (int): Number of questions where start year was asked.
     """
+    # fixed attribute layout; counters are bumped several times every round
+    __slots__ = (
+        "correct_names",
+        "correct_orders",
+        "correct_questions",
+        "correct_years",
+        "half_correct_questions",
+        "name_questions",
+        "order_questions",
+        "total_questions",
+        "year_questions",
+    )
+
     def __init__(self) -> None:
         """Initialize all statistics counters to zero."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all statistics counters back to zero."""
         self.total_questions = 0
         self.correct_questions = 0
         self.half_correct_questions = 0
@@ -29,28 +46,50 @@ class QuizStatistics:
         self.correct_years = 0
         self.year_questions = 0
 
-    def record_year_question(self, *, correct_name: bool, correct_order: bool) -> None:
-        """Record statistics for a 'year' type question.
+    def record(self,
+               *,
+               correct_name: bool | None = None,
+               correct_order: bool | None = None,
+               correct_year: bool | None = None) -> None:
+        """Record statistics for a question, given the results of the parts that were asked.
 
         Args:
-            correct_name (bool): Whether the president's name was answered correctly.
-            correct_order (bool): Whether the order number was answered correctly.
+            correct_name (bool | None): Whether the president's name was answered correctly, if asked.
+            correct_order (bool | None): Whether the order number was answered correctly, if asked.
+            correct_year (bool | None): Whether the start year was answered correctly, if asked.
         """
         self.total_questions += 1
-        self.name_questions += 1
-        self.order_questions += 1
 
-        if correct_name and correct_order:
-            self.correct_questions += 1
+        # bools are ints, so results are added straight onto the counters
+        if correct_name is not None:
+            self.name_questions += 1
+            self.correct_names += correct_name
 
-        if correct_name or correct_order:
-            self.half_correct_questions += 1
+        if correct_order is not None:
+            self.order_questions += 1
+            self.correct_orders += correct_order
 
-        if correct_name:
-            self.correct_names += 1
+        if correct_year is not None:
+            self.year_questions += 1
+            self.correct_years += correct_year
 
-        if correct_order:
-            self.correct_orders += 1
+        # None (not asked) is falsy, so this is whether any asked part was correct
+        any_correct = bool(correct_name or correct_order or correct_year)
+        self.half_correct_questions += any_correct
+        # fully correct: something was correct and no asked part was wrong
+        self.correct_questions += (any_correct
+                                   and correct_name is not False
+                                   and correct_order is not False
+                                   and correct_year is not False)
+
+    def record_year_question(self, *, correct_name: bool, correct_order: bool) -> None:
+        """Record statistics for a 'year' type question.
+
+        Args:
+            correct_name (bool): Whether the president's name was answered correctly.
+            correct_order (bool): Whether the order number was answered correctly.
+        """
+        self.record(correct_name=correct_name, correct_order=correct_order)
 
     def record_order_question(self, *, correct_name: bool, correct_year: bool) -> None:
         """Record statistics for an 'order' type question.
@@ -59,21 +98,7 @@ class QuizStatistics:
             correct_name (bool): Whether the president's name was answered correctly.
             correct_year (bool): Whether the start year was answered correctly.
         """
-        self.total_questions += 1
-        self.name_questions += 1
-        self.year_questions += 1
-
-        if correct_name and correct_year:
-            self.correct_questions += 1
-
-        if correct_name or correct_year:
-            self.half_correct_questions += 1
-
-        if correct_name:
-            self.correct_names += 1
-
-        if correct_year:
-            self.correct_years += 1
+        self.record(correct_name=correct_name, correct_year=correct_year)
 
     def record_name_question(self, *, correct_order: bool, correct_year: bool) -> None:
         """Record statistics for a 'name' type question.
@@ -82,21 +107,7 @@ class QuizStatistics:
             correct_order (bool): Whether the order number was answered correctly.
             correct_year (bool): Whether the start year was answered correctly.
         """
-        self.total_questions += 1
-        self.order_questions += 1
-        self.year_questions += 1
-
-        if correct_order and correct_year:
-            self.correct_questions += 1
-
-        if correct_order or correct_year:
-            self.half_correct_questions += 1
-
-        if correct_order:
-            self.correct_orders += 1
-
-        if correct_year:
-            self.correct_years += 1
+        self.record(correct_order=correct_order, correct_year=correct_year)
 
     def pretty_print(self) -> str:
         """Return a formatted string summarizing all statistics for the quiz game.
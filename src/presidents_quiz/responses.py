@@ -1,82 +1,49 @@
-from presidents_quiz.presidents import President  # noqa: TC001 breaks 3.10 - 3.13
-
-__all__ = ["get_response"]
-
-def _get_year_response(president: President, *, check_name_result: bool, check_order_result: bool) -> str:
-    """Return response based on which parts were correct in year response."""
-    if check_name_result and check_order_result:
-        return "Correct!"
-
-    if not check_order_result and not check_name_result:
-        return (
-            f"Wrong! The correct answer is president {president}, "
-            f"order number {' and '.join(president.order_numbers)}."
-        )
-
-    if not check_order_result:
-        return (
-            f"Wrong order number! The correct order number is "
-            f"{' and '.join(president.order_numbers)}."
-        )
-
-    if not check_name_result:
-        return f"Wrong president! The correct president is {president}."
-
-    # should not be possible
-    msg = "Unexpected combination of results."
-    raise RuntimeError(msg)
-
-def _get_order_response(president: President, *, check_name_result: bool, check_year_result: bool) -> str:
-    """Return response based on which parts were correct in order response."""
-    if check_name_result and check_year_result:
-        return "Correct!"
-
-    if not check_year_result and not check_name_result:
-        return (
-            f"Wrong! The correct answer is president {president}, "
-            f"start year {' and '.join(president.start_year)}."
-        )
-
-    if not check_year_result:
-        return (
-            f"Wrong start year! The correct start year is "
-            f"{' and '.join(president.start_year)}."
-        )
-
-    if not check_name_result:
-        return f"Wrong president! The correct president is {president}."
-
-    # should not be possible
-    msg = "Unexpected combination of results."
-    raise RuntimeError(msg)
-
-def _get_name_response(president: President, *, check_order_result: bool, check_year_result: bool) -> str:
-    """Return response based on which parts were correct in name response."""
-    if check_order_result and check_year_result:
+import functools
+from collections.abc import Callable  # noqa: TC003 breaks 3.10 - 3.13
+
+from presidents_quiz.presidents import QUESTION_NAME, QUESTION_ORDER, QUESTION_YEAR, President
+
+__all__ = ["get_question_response", "get_response"]
+
+# keyword names of the results, in the order get_response takes them
+_RESULT_NAMES = ("check_name_result", "check_order_result", "check_year_result")
+
+# indices into _RESULT_NAMES of the two results each question type is answered with
+_QUESTION_RESULTS = {
+    QUESTION_YEAR: (0, 1),
+    QUESTION_ORDER: (0, 2),
+    QUESTION_NAME: (1, 2),
+}
+
+# question type -> (label, correct value) of the two parts it is answered with, in asking order
+_QUESTION_PARTS: dict[str, tuple[tuple[str, Callable[[President], str]], tuple[str, Callable[[President], str]]]] = {
+    # year questions are answered with name and order number
+    QUESTION_YEAR: (("president", str), ("order number", lambda p: p.order_numbers_str)),
+    # order questions are answered with name and start year
+    QUESTION_ORDER: (("president", str), ("start year", lambda p: p.start_year_str)),
+    # name questions are answered with order number and start year
+    QUESTION_NAME: (("order number", lambda p: p.order_numbers_str), ("start year", lambda p: p.start_year_str)),
+}
+
+# at most 45 presidents x 3 question types x 4 result combinations, so the cache stays small
+@functools.cache
+def get_question_response(president: President, question_type: str, first_result: bool, second_result: bool) -> str:  # noqa: FBT001 results are data, not flags
+    """Return the response for the two results of a known question type, without validation.
+
+    The results are given in the order the question asks its parts: name then order number for
+    year questions, name then start year for order questions, and order number then start year
+    for name questions.
+    """
+    if first_result and second_result:
         return "Correct!"
 
-    if not check_year_result and not check_order_result:
-        return (
-            f"Wrong! The correct answer is order number "
-            f"{' and '.join(president.order_numbers)}, "
-            f"start year {' and '.join(president.start_year)}."
-        )
+    (first_label, first_value), (second_label, second_value) = _QUESTION_PARTS[question_type]
+    if not first_result and not second_result:
+        return f"Wrong! The correct answer is {first_label} {first_value(president)}, {second_label} {second_value(president)}."
 
-    if not check_year_result:
-        return (
-            f"Wrong start year! The correct start year is "
-            f"{' and '.join(president.start_year)}."
-        )
-
-    if not check_order_result:
-        return (
-            f"Wrong order number! The correct order number is "
-            f"{' and '.join(president.order_numbers)}."
-        )
-
-    # should not be possible
-    msg = "Unexpected combination of results."
-    raise RuntimeError(msg)
+    # exactly one part is wrong
+    label, value = (second_label, second_value) if first_result else (first_label, first_value)
+    return f"Wrong {label}! The correct {label} is {value(president)}."
 
 def get_response(president: President,
                  question_type: str,
@@ -85,26 +52,17 @@ def get_response(president: President,
                  check_order_result: bool | None = None,
                  check_year_result: bool | None = None) -> str:
     """Return appropriate response based on which parts were correct."""
-    if question_type == "year":
-        if check_name_result is None or check_order_result is None:
-            msg = f"Both check_name_result and check_order_result must be provided for '{question_type}' question type."
-            raise ValueError(msg)
-
-        return _get_year_response(president, check_name_result=check_name_result, check_order_result=check_order_result)
-
-    if question_type == "order":
-        if check_name_result is None or check_year_result is None:
-            msg = f"Both check_name_result and check_year_result must be provided for '{question_type}' question type."
-            raise ValueError(msg)
-
-        return _get_order_response(president, check_name_result=check_name_result, check_year_result=check_year_result)
-
-    if question_type == "name":
-        if check_order_result is None or check_year_result is None:
-            msg = f"Both check_order_result and check_year_result must be provided for '{question_type}' question type."
-            raise ValueError(msg)
-
-        return _get_name_response(president, check_order_result=check_order_result, check_year_result=check_year_result)
-
-    msg = "Unknown question type: " + question_type
-    raise ValueError(msg)
+    try:
+        first, second = _QUESTION_RESULTS[question_type]
+    except KeyError:
+        msg = "Unknown question type: " + question_type
+        raise ValueError(msg) from None
+
+    results = (check_name_result, check_order_result, check_year_result)
+    first_result = results[first]
+    second_result = results[second]
+    if first_result is None or second_result is None:
+        msg = f"Both {_RESULT_NAMES[first]} and {_RESULT_NAMES[second]} must be provided for '{question_type}' question type."
+        raise ValueError(msg)
+
+    return get_question_response(president, question_type, first_result, second_result)
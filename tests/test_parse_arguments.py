@@ -1,10 +1,9 @@
 import logging
-import sys
 import typing
 
 import pytest
 
-from presidents_quiz.main import parse_arguments
+from presidents_quiz.main import SeverityFormatter, parse_arguments
 from presidents_quiz.presidents import NUM_PRESIDENTS
 from presidents_quiz.quiz_settings import QuizSettings
 
@@ -13,31 +12,23 @@ root = logging.getLogger()
 @pytest.fixture(autouse=True)
 def reset_logger() -> typing.Generator[None, None, None]:  # noqa: UP043 3.10 - 3.12 require all three type arguments
     """Keep root logger isolated per test: clear handlers and reset level."""
-    logger = root
-    old_handlers = list(logger.handlers)
-    old_level = logger.level
-    logger.handlers = []
-    logger.setLevel(logging.NOTSET)
+    old_handlers = root.handlers
+    old_level = root.level
+    # swap in a fresh list so the prior one comes back untouched, without re-adding each handler
+    root.handlers = []
+    root.setLevel(logging.NOTSET)
     yield
-    logger.handlers = []
-    logger.setLevel(old_level)
-    # restore prior handlers if any (probably none for this module)
-    for h in old_handlers:
-        logger.addHandler(h)
+    root.handlers = old_handlers
+    root.setLevel(old_level)
 
 def run_parse(args: list[str]) -> QuizSettings:
-    """Run parse_arguments with a temporary sys.argv.
+    """Run parse_arguments on args directly, leaving sys.argv untouched.
 
     Returns the settings object that was mutated.
     """
     settings = QuizSettings()
-    argv_backup = sys.argv[:]
-    try:
-        sys.argv = ["prog", *args]
-        parse_arguments(settings)
-        return settings
-    finally:
-        sys.argv = argv_backup
+    parse_arguments(settings, args)
+    return settings
 
 
 # defaults
@@ -52,13 +43,22 @@ def test_defaults_update_settings_and_logger_installed() -> None:
     assert s.allow_ambiguity is False
 
     # One handler with the custom SeverityFormatter should be attached
-    handlers = [h for h in root.handlers if h.formatter.__class__.__name__ == "SeverityFormatter"]
+    handlers = [h for h in root.handlers if isinstance(h.formatter, SeverityFormatter)]
     assert len(handlers) == 1
 
     # Default verbosity -> INFO level
     assert root.level == logging.INFO
 
 
+def test_parsing_twice_attaches_one_handler() -> None:
+    run_parse([])
+    run_parse(["-v", "2"])
+    handlers = [h for h in root.handlers if isinstance(h.formatter, SeverityFormatter)]
+    assert len(handlers) == 1
+    # the level still follows the latest verbosity
+    assert root.level == logging.DEBUG
+
+
 # -r and -e flags
 
 def test_repeat_flag_sets_repeat_true() -> None:
@@ -132,6 +132,16 @@ def test_severity_formatter_output_for_verbose_debug(capsys: pytest.CaptureFixtu
     assert "[ERROR] emsg" in outlines
 
 
+def test_severity_formatter_unknown_level_uses_plain_message(capsys: pytest.CaptureFixture[str]) -> None:
+    run_parse(["-v", "2"])
+
+    # custom level between INFO and WARNING has no dedicated format
+    root.log(25, "custom")
+
+    out = capsys.readouterr().err
+    assert "custom" in out.split("\n")
+
+
 def test_verbosity_info_filters_debug_and_formats(capsys: pytest.CaptureFixture[str]) -> None:
     run_parse(["-v", "1"])
     root.debug("should_not_show")
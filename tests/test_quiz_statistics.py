@@ -1,202 +1,141 @@
-from presidents_quiz.quiz_statistics import QuizStatistics
-
-
-def test_initial_state_is_zero() -> None:
-    s = QuizStatistics()
-    assert s.total_questions == 0
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 0
-    assert s.correct_names == 0
-    assert s.name_questions == 0
-    assert s.correct_orders == 0
-    assert s.order_questions == 0
-    assert s.correct_years == 0
-    assert s.year_questions == 0
-
-
-# record_year_question
-
-def test_record_year_question_both_correct() -> None:
-    s = QuizStatistics()
-    s.record_year_question(correct_name=True, correct_order=True)
-
-    assert s.total_questions == 1
-    assert s.name_questions == 1
-    assert s.order_questions == 1
-
-    # both correct -> counts increment
-    assert s.correct_questions == 1
-    assert s.half_correct_questions == 1
-    assert s.correct_names == 1
-    assert s.correct_orders == 1
-
-    # no year fields touched here
-    assert s.year_questions == 0
-    assert s.correct_years == 0
-
-
-def test_record_year_question_half_correct_name_only() -> None:
-    s = QuizStatistics()
-    s.record_year_question(correct_name=True, correct_order=False)
-
-    assert s.total_questions == 1
-    assert s.name_questions == 1
-    assert s.order_questions == 1
-
-    # half correct
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 1
-    assert s.correct_names == 1
-    assert s.correct_orders == 0
-
-
-def test_record_year_question_none_correct() -> None:
-    s = QuizStatistics()
-    s.record_year_question(correct_name=False, correct_order=False)
-
-    assert s.total_questions == 1
-    assert s.name_questions == 1
-    assert s.order_questions == 1
-
-    # none correct -> no correct or half-correct increments
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 0
-    assert s.correct_names == 0
-    assert s.correct_orders == 0
-
-
-# record_order_question
-
-def test_record_order_question_both_correct() -> None:
-    s = QuizStatistics()
-    s.record_order_question(correct_name=True, correct_year=True)
-
-    assert s.total_questions == 1
-    assert s.name_questions == 1
-    assert s.year_questions == 1
-
-    assert s.correct_questions == 1
-    assert s.half_correct_questions == 1
-    assert s.correct_names == 1
-    assert s.correct_years == 1
-
-    # no order fields touched here
-    assert s.order_questions == 0
-    assert s.correct_orders == 0
-
+import pytest
 
-def test_record_order_question_half_correct_year_only() -> None:
-    s = QuizStatistics()
-    s.record_order_question(correct_name=False, correct_year=True)
-
-    assert s.total_questions == 1
-    assert s.name_questions == 1
-    assert s.year_questions == 1
-
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 1
-    assert s.correct_names == 0
-    assert s.correct_years == 1
-
-
-def test_record_order_question_none_correct() -> None:
-    s = QuizStatistics()
-    s.record_order_question(correct_name=False, correct_year=False)
-
-    assert s.total_questions == 1
-    assert s.name_questions == 1
-    assert s.year_questions == 1
-
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 0
-    assert s.correct_names == 0
-    assert s.correct_years == 0
-
-
-# record_name_question
-
-def test_record_name_question_both_correct() -> None:
-    s = QuizStatistics()
-    s.record_name_question(correct_order=True, correct_year=True)
-
-    assert s.total_questions == 1
-    assert s.order_questions == 1
-    assert s.year_questions == 1
-
-    assert s.correct_questions == 1
-    assert s.half_correct_questions == 1
-    assert s.correct_orders == 1
-    assert s.correct_years == 1
-
-    # no name fields touched here
-    assert s.name_questions == 0
-    assert s.correct_names == 0
-
-
-def test_record_name_question_half_correct_order_only() -> None:
-    s = QuizStatistics()
-    s.record_name_question(correct_order=True, correct_year=False)
-
-    assert s.total_questions == 1
-    assert s.order_questions == 1
-    assert s.year_questions == 1
-
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 1
-    assert s.correct_orders == 1
-    assert s.correct_years == 0
-
-
-def test_record_name_question_none_correct() -> None:
-    s = QuizStatistics()
-    s.record_name_question(correct_order=False, correct_year=False)
+from presidents_quiz.quiz_statistics import QuizStatistics
 
-    assert s.total_questions == 1
-    assert s.order_questions == 1
-    assert s.year_questions == 1
 
-    assert s.correct_questions == 0
-    assert s.half_correct_questions == 0
-    assert s.correct_orders == 0
-    assert s.correct_years == 0
+@pytest.fixture
+def stats() -> QuizStatistics:
+    """Return a fresh statistics object for each test."""
+    return QuizStatistics()
+
+
+# every counter QuizStatistics keeps
+COUNTERS = (
+    "total_questions",
+    "correct_questions",
+    "half_correct_questions",
+    "correct_names",
+    "name_questions",
+    "correct_orders",
+    "order_questions",
+    "correct_years",
+    "year_questions",
+)
+ZERO = dict.fromkeys(COUNTERS, 0)
+
+
+def snapshot(stats: QuizStatistics) -> dict[str, int]:
+    """Return every counter of stats, so one comparison shows all mismatches at once."""
+    return {counter: getattr(stats, counter) for counter in COUNTERS}
+
+
+def test_initial_state_is_zero(stats: QuizStatistics) -> None:
+    assert snapshot(stats) == ZERO
+
+
+def test_statistics_uses_slots(stats: QuizStatistics) -> None:
+    assert not hasattr(stats, "__dict__")
+
+
+def test_reset_zeroes_counters(stats: QuizStatistics) -> None:
+    stats.record_year_question(correct_name=True, correct_order=True)
+    stats.reset()
+    assert snapshot(stats) == ZERO
+
+
+# record_*_question
+
+# (method, its two results, expected non-zero counters)
+RECORD_QUESTION_CASES = [
+    # year questions are answered with name and order, and never touch the year fields
+    ("record_year_question", {"correct_name": True, "correct_order": True},
+     {"total_questions": 1, "name_questions": 1, "order_questions": 1, "correct_questions": 1, "half_correct_questions": 1,
+      "correct_names": 1, "correct_orders": 1}),
+    ("record_year_question", {"correct_name": True, "correct_order": False},
+     {"total_questions": 1, "name_questions": 1, "order_questions": 1, "half_correct_questions": 1, "correct_names": 1}),
+    ("record_year_question", {"correct_name": False, "correct_order": False},
+     {"total_questions": 1, "name_questions": 1, "order_questions": 1}),
+    # order questions are answered with name and year, and never touch the order fields
+    ("record_order_question", {"correct_name": True, "correct_year": True},
+     {"total_questions": 1, "name_questions": 1, "year_questions": 1, "correct_questions": 1, "half_correct_questions": 1,
+      "correct_names": 1, "correct_years": 1}),
+    ("record_order_question", {"correct_name": False, "correct_year": True},
+     {"total_questions": 1, "name_questions": 1, "year_questions": 1, "half_correct_questions": 1, "correct_years": 1}),
+    ("record_order_question", {"correct_name": False, "correct_year": False},
+     {"total_questions": 1, "name_questions": 1, "year_questions": 1}),
+    # name questions are answered with order and year, and never touch the name fields
+    ("record_name_question", {"correct_order": True, "correct_year": True},
+     {"total_questions": 1, "order_questions": 1, "year_questions": 1, "correct_questions": 1, "half_correct_questions": 1,
+      "correct_orders": 1, "correct_years": 1}),
+    ("record_name_question", {"correct_order": True, "correct_year": False},
+     {"total_questions": 1, "order_questions": 1, "year_questions": 1, "half_correct_questions": 1, "correct_orders": 1}),
+    ("record_name_question", {"correct_order": False, "correct_year": False},
+     {"total_questions": 1, "order_questions": 1, "year_questions": 1}),
+]
+
+@pytest.mark.parametrize(("method", "results", "expected"), RECORD_QUESTION_CASES)
+def test_record_question(stats: QuizStatistics, method: str, results: dict[str, bool], expected: dict[str, int]) -> None:
+    getattr(stats, method)(**results)
+    assert snapshot(stats) == {**ZERO, **expected}
 
 
 # cumulative behavior
 
-def test_cumulative_increments_across_mixed_calls() -> None:
-    s = QuizStatistics()
+def test_cumulative_increments_across_mixed_calls(stats: QuizStatistics) -> None:
     # year: both correct
-    s.record_year_question(correct_name=True, correct_order=True)
+    stats.record_year_question(correct_name=True, correct_order=True)
     # order: half correct (year only)
-    s.record_order_question(correct_name=False, correct_year=True)
+    stats.record_order_question(correct_name=False, correct_year=True)
     # name: none correct
-    s.record_name_question(correct_order=False, correct_year=False)
-
-    assert s.total_questions == 3
-    assert s.correct_questions == 1
-    assert s.half_correct_questions == 2
-
-    # name stats: one correct (from first call), two name questions overall (year+order paths)
-    assert s.name_questions == 2
-    assert s.correct_names == 1
-
-    # order stats: two order questions overall (year+name paths), one correct (first call)
-    assert s.order_questions == 2
-    assert s.correct_orders == 1
-
-    # year stats: two year questions overall (order+name paths), one correct (second call)
-    assert s.year_questions == 2
-    assert s.correct_years == 1
-
-def test_pretty_print() -> None:
-    s = QuizStatistics()
+    stats.record_name_question(correct_order=False, correct_year=False)
+
+    assert snapshot(stats) == {
+        **ZERO,
+        "total_questions": 3,
+        "correct_questions": 1,
+        "half_correct_questions": 2,
+        # one correct name (first call), two name questions overall (year+order paths)
+        "name_questions": 2,
+        "correct_names": 1,
+        # one correct order (first call), two order questions overall (year+name paths)
+        "order_questions": 2,
+        "correct_orders": 1,
+        # one correct year (second call), two year questions overall (order+name paths)
+        "year_questions": 2,
+        "correct_years": 1,
+    }
+
+
+# record
+
+def test_record_counts_only_parts_given(stats: QuizStatistics) -> None:
+    stats.record(correct_name=True, correct_year=False)
+
+    # order was not asked, so its counters stay zero
+    assert snapshot(stats) == {
+        **ZERO,
+        "total_questions": 1,
+        "half_correct_questions": 1,
+        "name_questions": 1,
+        "correct_names": 1,
+        "year_questions": 1,
+    }
+
+
+def test_record_matches_record_name_question(stats: QuizStatistics) -> None:
+    stats.record_name_question(correct_order=True, correct_year=True)
+    direct = QuizStatistics()
+    direct.record(correct_order=True, correct_year=True)
+    assert snapshot(stats) == snapshot(direct)
+
+def test_pretty_print(stats: QuizStatistics) -> None:
     # year: both correct
-    s.record_year_question(correct_name=True, correct_order=True)
+    stats.record_year_question(correct_name=True, correct_order=True)
     # order: half correct (year only)
-    s.record_order_question(correct_name=False, correct_year=True)
+    stats.record_order_question(correct_name=False, correct_year=True)
     # name: none correct
-    s.record_name_question(correct_order=False, correct_year=False)
+    stats.record_name_question(correct_order=False, correct_year=False)
 
     expected = ("total_questions=3, correct_questions=1, half_correct_questions=2, correct_names=1, name_questions=2, "
                 "correct_orders=1, order_questions=2, correct_years=1, year_questions=2")
-    assert s.pretty_print() == expected
+    assert stats.pretty_print() == expected
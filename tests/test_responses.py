@@ -1,115 +1,107 @@
 import pytest
 
 from presidents_quiz.presidents import GEORGE_WASHINGTON, GROVER_CLEVELAND
-from presidents_quiz.responses import (
-    _get_name_response,  # pyright: ignore[reportPrivateUsage] Fine for testing
-    _get_order_response,  # pyright: ignore[reportPrivateUsage] Fine for testing
-    _get_year_response,  # pyright: ignore[reportPrivateUsage] Fine for testing
-    get_response,
-)
+from presidents_quiz.responses import get_question_response, get_response
 
-# get_year_response
+# year questions
 
 def test_get_year_response_correct() -> None:
-    assert _get_year_response(GEORGE_WASHINGTON, check_name_result=True, check_order_result=True) == "Correct!"
+    assert get_response(GEORGE_WASHINGTON, "year", check_name_result=True, check_order_result=True) == "Correct!"
 
 
 def test_get_year_response_both_wrong_message_singleton() -> None:
-    msg = _get_year_response(GEORGE_WASHINGTON, check_name_result=False, check_order_result=False)
+    msg = get_response(GEORGE_WASHINGTON, "year", check_name_result=False, check_order_result=False)
     assert msg == "Wrong! The correct answer is president George Washington, order number 1."
 
 
 def test_get_year_response_only_order_wrong() -> None:
-    msg = _get_year_response(GEORGE_WASHINGTON, check_name_result=True, check_order_result=False)
+    msg = get_response(GEORGE_WASHINGTON, "year", check_name_result=True, check_order_result=False)
     assert msg == "Wrong order number! The correct order number is 1."
 
 
 def test_get_year_response_only_name_wrong() -> None:
-    msg = _get_year_response(GEORGE_WASHINGTON, check_name_result=False, check_order_result=True)
+    msg = get_response(GEORGE_WASHINGTON, "year", check_name_result=False, check_order_result=True)
     assert msg == "Wrong president! The correct president is George Washington."
 
 
 def test_get_year_response_multi_term_joins_with_and() -> None:
-    msg = _get_year_response(GROVER_CLEVELAND, check_name_result=False, check_order_result=False)
+    msg = get_response(GROVER_CLEVELAND, "year", check_name_result=False, check_order_result=False)
     assert msg == "Wrong! The correct answer is president Grover Cleveland, order number 22 and 24."
 
 
-# get_order_response
+# order questions
 
 def test_get_order_response_correct() -> None:
-    assert _get_order_response(GEORGE_WASHINGTON, check_name_result=True, check_year_result=True) == "Correct!"
+    assert get_response(GEORGE_WASHINGTON, "order", check_name_result=True, check_year_result=True) == "Correct!"
 
 
 def test_get_order_response_both_wrong_message_singleton() -> None:
-    msg = _get_order_response(GEORGE_WASHINGTON, check_name_result=False, check_year_result=False)
+    msg = get_response(GEORGE_WASHINGTON, "order", check_name_result=False, check_year_result=False)
     assert msg == "Wrong! The correct answer is president George Washington, start year 1789."
 
 
 def test_get_order_response_only_year_wrong() -> None:
-    msg = _get_order_response(GEORGE_WASHINGTON, check_name_result=True, check_year_result=False)
+    msg = get_response(GEORGE_WASHINGTON, "order", check_name_result=True, check_year_result=False)
     assert msg == "Wrong start year! The correct start year is 1789."
 
 
 def test_get_order_response_only_name_wrong() -> None:
-    msg = _get_order_response(GEORGE_WASHINGTON, check_name_result=False, check_year_result=True)
+    msg = get_response(GEORGE_WASHINGTON, "order", check_name_result=False, check_year_result=True)
     assert msg == "Wrong president! The correct president is George Washington."
 
 
 def test_get_order_response_multi_term_joins_with_and() -> None:
-    msg = _get_order_response(GROVER_CLEVELAND, check_name_result=True, check_year_result=False)
+    msg = get_response(GROVER_CLEVELAND, "order", check_name_result=True, check_year_result=False)
     assert msg == "Wrong start year! The correct start year is 1885 and 1893."
 
 
-# get_name_response
+# name questions
 
 def test_get_name_response_correct() -> None:
-    assert _get_name_response(GEORGE_WASHINGTON, check_order_result=True, check_year_result=True) == "Correct!"
+    assert get_response(GEORGE_WASHINGTON, "name", check_order_result=True, check_year_result=True) == "Correct!"
 
 
 def test_get_name_response_both_wrong_message_singleton() -> None:
-    msg = _get_name_response(GEORGE_WASHINGTON, check_order_result=False, check_year_result=False)
+    msg = get_response(GEORGE_WASHINGTON, "name", check_order_result=False, check_year_result=False)
     assert msg == "Wrong! The correct answer is order number 1, start year 1789."
 
 
 def test_get_name_response_only_year_wrong() -> None:
-    msg = _get_name_response(GEORGE_WASHINGTON, check_order_result=True, check_year_result=False)
+    msg = get_response(GEORGE_WASHINGTON, "name", check_order_result=True, check_year_result=False)
     assert msg == "Wrong start year! The correct start year is 1789."
 
 
 def test_get_name_response_only_order_wrong() -> None:
-    msg = _get_name_response(GEORGE_WASHINGTON, check_order_result=False, check_year_result=True)
+    msg = get_response(GEORGE_WASHINGTON, "name", check_order_result=False, check_year_result=True)
     assert msg == "Wrong order number! The correct order number is 1."
 
 
 def test_get_name_response_multi_term_joins_with_and() -> None:
-    msg = _get_name_response(GROVER_CLEVELAND, check_order_result=False, check_year_result=False)
+    msg = get_response(GROVER_CLEVELAND, "name", check_order_result=False, check_year_result=False)
     assert msg == "Wrong! The correct answer is order number 22 and 24, start year 1885 and 1893."
 
 
 # get_response
 
-def test_get_response_routes_to_year() -> None:
-    expected = _get_year_response(GEORGE_WASHINGTON, check_name_result=True, check_order_result=False)
+def test_get_response_year_ignores_year_result() -> None:
     routed = get_response(
-        GEORGE_WASHINGTON, "year", check_name_result=True, check_order_result=False, check_year_result=None,
+        GEORGE_WASHINGTON, "year", check_name_result=True, check_order_result=False, check_year_result=True,
     )
-    assert routed == expected
+    assert routed == "Wrong order number! The correct order number is 1."
 
 
-def test_get_response_routes_to_order() -> None:
-    expected = _get_order_response(GEORGE_WASHINGTON, check_name_result=False, check_year_result=True)
+def test_get_response_order_ignores_order_result() -> None:
     routed = get_response(
-        GEORGE_WASHINGTON, "order", check_name_result=False, check_order_result=None, check_year_result=True,
+        GEORGE_WASHINGTON, "order", check_name_result=False, check_order_result=False, check_year_result=True,
     )
-    assert routed == expected
+    assert routed == "Wrong president! The correct president is George Washington."
 
 
-def test_get_response_routes_to_name() -> None:
-    expected = _get_name_response(GEORGE_WASHINGTON, check_order_result=True, check_year_result=False)
+def test_get_response_name_ignores_name_result() -> None:
     routed = get_response(
-        GEORGE_WASHINGTON, "name", check_name_result=None, check_order_result=True, check_year_result=False,
+        GEORGE_WASHINGTON, "name", check_name_result=False, check_order_result=True, check_year_result=False,
     )
-    assert routed == expected
+    assert routed == "Wrong start year! The correct start year is 1789."
 
 
 @pytest.mark.parametrize(
@@ -130,3 +122,25 @@ def test_get_response_unknown_type_raises() -> None:
     with pytest.raises(ValueError) as ei:  # noqa: PT011
         get_response(GEORGE_WASHINGTON, "foobar", check_name_result=True, check_order_result=True, check_year_result=True)
     assert "Unknown question type: foobar" in str(ei.value)
+
+
+# get_question_response
+
+@pytest.mark.parametrize(
+    ("qtype", "first_name", "second_name"),
+    [
+        ("year", "check_name_result", "check_order_result"),
+        ("order", "check_name_result", "check_year_result"),
+        ("name", "check_order_result", "check_year_result"),
+    ],
+)
+@pytest.mark.parametrize(("first", "second"), [(True, True), (True, False), (False, True), (False, False)])
+def test_get_question_response_matches_get_response(qtype: str, first_name: str, second_name: str, *,
+                                                    first: bool, second: bool) -> None:
+    expected = get_response(GROVER_CLEVELAND, qtype, **{first_name: first, second_name: second})
+    assert get_question_response(GROVER_CLEVELAND, qtype, first, second) == expected
+
+
+def test_get_question_response_reuses_built_message() -> None:
+    first = get_question_response(GROVER_CLEVELAND, "name", False, False)  # noqa: FBT003 positional results
+    assert get_question_response(GROVER_CLEVELAND, "name", False, False) is first  # noqa: FBT003 positional results
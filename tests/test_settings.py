@@ -1,16 +1,33 @@
 import pytest
 
 from presidents_quiz.main import NUM_PRESIDENTS, QuizSettings
+from presidents_quiz.presidents import presidents_in_range
 
+# resolved once for the parametrize tables below
+VERBOSE_QUIET = QuizSettings.VERBOSE_QUIET
+VERBOSE_NORMAL = QuizSettings.VERBOSE_NORMAL
+VERBOSE_VERBOSE = QuizSettings.VERBOSE_VERBOSE
+# full range using the module's NUM_PRESIDENTS, inclusive
+DEFAULT_RANGE = (1, NUM_PRESIDENTS)
 
 def test_defaults() -> None:
     s = QuizSettings()
     assert s.repeat_questions is False
     assert s.end_early is False
     assert s.allow_ambiguity is False
-    # Defaults to full range using the module's NUM_PRESIDENTS (+1 for slicing stop)
-    assert s.president_range == (1, NUM_PRESIDENTS + 1)
-    assert s.verbose_level == QuizSettings.VERBOSE_NORMAL  # 1
+    assert s.president_range == DEFAULT_RANGE
+    assert s.verbose_level == VERBOSE_NORMAL  # 1
+
+
+def test_default_range_covers_every_president() -> None:
+    # main() checks the range against the presidents it selects, even when parse_arguments never ran
+    start, end = QuizSettings().president_range
+    assert len(presidents_in_range(start, end)) == end - start + 1 == NUM_PRESIDENTS
+
+
+def test_settings_uses_slots() -> None:
+    s = QuizSettings()
+    assert not hasattr(s, "__dict__")
 
 
 @pytest.mark.parametrize(
@@ -19,7 +36,7 @@ def test_defaults() -> None:
         (1, 2),
         (1, 1),  # degenerate but allowed by constructor guard (start <= end)
         (2, 5),
-        (1, NUM_PRESIDENTS + 1),  # upper bound allowed by guard
+        DEFAULT_RANGE,  # upper bound allowed by guard
     ],
 )
 def test_valid_range_is_kept(rng: tuple[int, int]) -> None:
@@ -33,24 +50,24 @@ def test_valid_range_is_kept(rng: tuple[int, int]) -> None:
     [
         (0, 2),  # start < 1
         (2, 1),  # start > end
-        (1, NUM_PRESIDENTS + 2),  # end > NUM_PRESIDENTS + 1
+        (1, NUM_PRESIDENTS + 1),  # end > NUM_PRESIDENTS
     ],
 )
 def test_invalid_range_falls_back_to_default(rng: tuple[int, int]) -> None:
     s = QuizSettings()
     s.update(president_range=rng)
-    assert s.president_range == (1, NUM_PRESIDENTS + 1)
+    assert s.president_range == DEFAULT_RANGE
 
 
 @pytest.mark.parametrize(
     ("level", "expected"),
     [
-        (None, QuizSettings.VERBOSE_NORMAL),   # default path -> 1
-        (QuizSettings.VERBOSE_QUIET, QuizSettings.VERBOSE_QUIET),       # 0
-        (QuizSettings.VERBOSE_NORMAL, QuizSettings.VERBOSE_NORMAL),     # 1
-        (QuizSettings.VERBOSE_VERBOSE, QuizSettings.VERBOSE_VERBOSE),   # 2
-        (99, QuizSettings.VERBOSE_NORMAL),  # coerced to 1 if not in (0,1,2)
-        (-1, QuizSettings.VERBOSE_NORMAL),
+        (None, VERBOSE_NORMAL),               # default path -> 1
+        (VERBOSE_QUIET, VERBOSE_QUIET),       # 0
+        (VERBOSE_NORMAL, VERBOSE_NORMAL),     # 1
+        (VERBOSE_VERBOSE, VERBOSE_VERBOSE),   # 2
+        (99, VERBOSE_NORMAL),  # coerced to 1 if not in (0,1,2)
+        (-1, VERBOSE_NORMAL),
     ],
 )
 def test_verbose_level_handling(level: int | None, expected: int) -> None:
@@ -59,14 +76,28 @@ def test_verbose_level_handling(level: int | None, expected: int) -> None:
     assert s.verbose_level == expected
 
 
+def test_update_leaves_flags_not_passed_unchanged() -> None:
+    s = QuizSettings()
+    s.update(repeat_questions=True, end_early=True)
+    s.update(verbose_level=VERBOSE_QUIET)
+    assert s.repeat_questions is True
+    assert s.end_early is True
+
+
+def test_reset_restores_defaults() -> None:
+    s = QuizSettings()
+    s.update(repeat_questions=True, allow_ambiguity=True, president_range=(2, 5), verbose_level=VERBOSE_QUIET)
+    s.reset()
+    assert s.pretty_print() == QuizSettings().pretty_print()
+
 def test_flags_and_pretty_print_format() -> None:
     s = QuizSettings()
-    s.update(repeat_questions=True, end_early=True, president_range=(3, 10), verbose_level=QuizSettings.VERBOSE_VERBOSE, allow_ambiguity=False)
+    s.update(repeat_questions=True, end_early=True, president_range=(3, 10), verbose_level=VERBOSE_VERBOSE, allow_ambiguity=False)
     # ensure values stick (range is valid so no fallback)
     assert s.repeat_questions is True
     assert s.end_early is True
     assert s.president_range == (3, 10)
-    assert s.verbose_level == QuizSettings.VERBOSE_VERBOSE
+    assert s.verbose_level == VERBOSE_VERBOSE
     assert s.allow_ambiguity is False
 
     # pretty_print should match exact formatting